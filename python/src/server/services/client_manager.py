@@ -7,12 +7,21 @@ Qdrant client for local vector storage.
 
 from __future__ import annotations
 
+import atexit
 import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Literal
 
-from qdrant_client import QdrantClient
+from qdrant_client import QdrantClient, models
+
+try:
+    # Optional faster SQLite driver: a thin wrapper over the C API with
+    # lower per-call overhead than the stdlib module.
+    import apsw
+except ImportError:
+    apsw = None
 
 
 # ---------------------------------------------------------------------------
@@ -21,21 +30,234 @@ from qdrant_client import QdrantClient
 
 DB_PATH = Path(os.getenv("ARCHON_DB_PATH", "archon.db"))
 
+USE_APSW = apsw is not None and os.getenv("ARCHON_USE_APSW", "0") == "1"
+
+# Idempotent schema bootstrap for the local SQLite deployment.  Mirrors the
+# subset of migration/complete_setup.sql that the SQLite-backed services
+# actually use.  The indexes cover the hot queries: list_projects orders by
+# created_at DESC, and the task listing index stores every projected column
+# ordered by (project_id, id), so list_tasks(project_id=...) is one
+# sequential covering range scan — the clustered-read layout a WITHOUT
+# ROWID table with PRIMARY KEY (project_id, id) would give, without
+# sacrificing the globally unique autoincrement id the task API relies on.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archon_projects (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    github_repo TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS archon_tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'todo',
+    assignee TEXT NOT NULL DEFAULT 'User',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+DROP INDEX IF EXISTS idx_tasks_project_id;
+CREATE INDEX IF NOT EXISTS idx_tasks_project_listing ON archon_tasks(
+    project_id, id, status, title, description, assignee, created_at, updated_at
+);
+CREATE INDEX IF NOT EXISTS idx_projects_created_at ON archon_projects(created_at DESC);
+"""
+
+# WAL is persistent on the database file, so it only needs to be enabled by
+# the first connection of the process.  The same goes for the schema.
+_wal_enabled = False
+_schema_ensured = False
+
+
+def _configure_connection(conn: sqlite3.Connection | _APSWConnection) -> None:
+    """Apply per-connection PRAGMA tuning for local CRUD workloads."""
+
+    global _wal_enabled, _schema_ensured
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    if not _schema_ensured:
+        conn.executescript(_SCHEMA)
+        _schema_ensured = True
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+
+
+class _Row(dict):
+    """Row mapping that, like ``sqlite3.Row``, also supports integer indexing."""
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return tuple(self.values())[key]
+        return super().__getitem__(key)
+
+
+def _dict_row(cursor, row):
+    """apsw row trace producing rows that mirror ``sqlite3.Row`` access."""
+
+    return _Row(zip((d[0] for d in cursor.getdescription()), row))
 
-def get_db() -> sqlite3.Connection:
-    """Return a SQLite connection with ``Row`` factory enabled."""
 
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+class _APSWCursor:
+    """DB-API-flavoured adapter over an apsw cursor.
+
+    Exposes the small cursor surface the services rely on
+    (``execute``/``fetchone``/iteration/``lastrowid``/``rowcount``).
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._cur = conn.cursor()
+        self._rows = iter(())
+
+    def execute(self, sql, params=()):
+        # Materialise eagerly: apsw cursors run lazily, and an unexhausted
+        # statement (e.g. INSERT ... RETURNING) blocks COMMIT on the
+        # connection.
+        self._rows = iter(list(self._cur.execute(sql, params)))
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._rows = iter(list(self._cur.executemany(sql, seq_of_params)))
+        return self
+
+    def fetchone(self):
+        return next(self._rows, None)
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def __iter__(self):
+        return self._rows
+
+    @property
+    def lastrowid(self):
+        return self._conn.last_insert_rowid()
+
+    @property
+    def rowcount(self):
+        return self._conn.changes()
+
+
+class _APSWConnection:
+    """Minimal ``sqlite3.Connection``-compatible facade over apsw.
+
+    apsw has no implicit transactions, so ``commit``/``rollback`` simply
+    close whatever transaction the cursor context opened explicitly.
+    """
+
+    def __init__(self, path: Path):
+        self._conn = apsw.Connection(str(path), statementcachesize=512)
+        self._conn.setrowtrace(_dict_row)
+
+    def cursor(self) -> _APSWCursor:
+        return _APSWCursor(self._conn)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
+
+    def executescript(self, sql):
+        self._conn.cursor().execute(sql)
+
+    def commit(self):
+        if self._conn.in_transaction:
+            self._conn.cursor().execute("COMMIT")
+
+    def rollback(self):
+        if self._conn.in_transaction:
+            self._conn.cursor().execute("ROLLBACK")
+
+    def close(self):
+        try:
+            self._conn.close()
+        except apsw.Error:
+            pass
+
+
+# One reusable connection per thread.  SQLite keeps its page cache on the
+# connection, so recycling it across calls avoids both the connect/PRAGMA
+# setup cost and a cold cache on every operation.
+_pool = threading.local()
+_pool_lock = threading.Lock()
+_pool_connections: list[sqlite3.Connection | _APSWConnection] = []
+
+
+def get_db() -> sqlite3.Connection | _APSWConnection:
+    """Return the calling thread's tuned SQLite connection.
+
+    The connection is created (and configured — see
+    :func:`_configure_connection`) on first use and then reused for the
+    lifetime of the thread.  WAL journaling keeps readers from blocking
+    behind writers and, combined with ``synchronous=NORMAL``, avoids an
+    fsync of the main database file on every commit.
+    """
+
+    conn = getattr(_pool, "conn", None)
+    if conn is None:
+        if USE_APSW:
+            conn = _APSWConnection(DB_PATH)
+        else:
+            # A generous statement cache lets the hot CRUD queries reuse
+            # their compiled plans instead of re-parsing the SQL text on
+            # every call (apsw caches statements itself).
+            # isolation_level=None disables the module's implicit
+            # transaction handling; SQLiteCursorContext issues explicit
+            # BEGIN statements instead.
+            conn = sqlite3.connect(DB_PATH, cached_statements=512, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+        _configure_connection(conn)
+        _pool.conn = conn
+        with _pool_lock:
+            _pool_connections.append(conn)
     return conn
 
 
+@atexit.register
+def _close_pool() -> None:  # pragma: no cover - process teardown
+    global _qdrant
+    with _pool_lock:
+        for conn in _pool_connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _pool_connections.clear()
+    if _qdrant is not None:
+        try:
+            _qdrant.close()
+        except Exception:
+            pass
+        _qdrant = None
+
+
 class SQLiteCursorContext:
-    """Context manager yielding a cursor and committing on exit."""
+    """Context manager yielding a cursor and committing on exit.
+
+    The underlying per-thread connection is pooled by :func:`get_db`, so
+    exiting the context only commits or rolls back — it never closes the
+    connection.
+
+    Write contexts open with ``BEGIN IMMEDIATE`` so the write lock is
+    taken up front: contending writers queue on ``busy_timeout`` instead
+    of failing with ``SQLITE_BUSY`` when a deferred transaction tries to
+    upgrade mid-flight.  Read contexts use ``BEGIN DEFERRED`` and, under
+    WAL, never block writers.
+    """
+
+    def __init__(self, mode: Literal["read", "write"] = "write"):
+        self.mode = mode
 
-    def __enter__(self) -> sqlite3.Cursor:  # pragma: no cover - trivial
+    def __enter__(self) -> sqlite3.Cursor | _APSWCursor:  # pragma: no cover - trivial
         self.conn = get_db()
         self.cur = self.conn.cursor()
+        self.cur.execute("BEGIN IMMEDIATE" if self.mode == "write" else "BEGIN DEFERRED")
         return self.cur
 
     def __exit__(self, exc_type, exc, tb):  # pragma: no cover - trivial
@@ -43,7 +265,6 @@ class SQLiteCursorContext:
             self.conn.commit()
         else:
             self.conn.rollback()
-        self.conn.close()
 
 
 # ---------------------------------------------------------------------------
@@ -52,16 +273,59 @@ class SQLiteCursorContext:
 
 QDRANT_PATH = os.getenv("QDRANT_PATH", "./qdrant_db")
 
+# Must match the dimensions used by the embedding provider (see
+# EMBEDDING_DIMENSIONS handling in embedding_service).
+EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+
+# Collections used by BaseSearchStrategy.  Stored vectors are scalar
+# quantized to int8 so ANN candidates stream 4x less data from RAM; the
+# original float vectors are kept for rescoring.
+QDRANT_COLLECTIONS = ("docs", "code")
+
+
+def ensure_qdrant_collections(client: QdrantClient) -> None:
+    """Create the search collections with int8 quantization if missing."""
+
+    for name in QDRANT_COLLECTIONS:
+        if client.collection_exists(name):
+            continue
+        client.create_collection(
+            collection_name=name,
+            vectors_config=models.VectorParams(
+                size=EMBEDDING_DIMENSIONS, distance=models.Distance.COSINE
+            ),
+            quantization_config=models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, always_ram=True
+                )
+            ),
+        )
+
+
+# Single long-lived client shared by the whole process.  File-based Qdrant
+# loads the index into RAM on open (and holds a file lock), so creating a
+# client per request would pay a cold start every time.
+_qdrant: QdrantClient | None = None
+_qdrant_lock = threading.Lock()
+
 
 def get_qdrant_client() -> QdrantClient:
-    """Create a local Qdrant client instance.
+    """Return the process-wide local Qdrant client instance.
 
     The client stores data on the filesystem under ``QDRANT_PATH`` which
     defaults to ``./qdrant_db``.  Using the file based API keeps deployment
-    completely local without any external dependencies.
+    completely local without any external dependencies.  The instance is
+    created on first use and reused afterwards.
     """
 
-    return QdrantClient(path=QDRANT_PATH)
+    global _qdrant
+    if _qdrant is None:
+        with _qdrant_lock:
+            if _qdrant is None:
+                client = QdrantClient(path=QDRANT_PATH)
+                ensure_qdrant_collections(client)
+                _qdrant = client
+    return _qdrant
 
 
 __all__ = ["get_db", "get_qdrant_client", "SQLiteCursorContext"]
@@ -9,8 +9,9 @@ the core project–management features.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any
 
 from ..client_manager import SQLiteCursorContext
@@ -18,13 +19,62 @@ from ...config.logfire_config import get_logger
 
 logger = get_logger(__name__)
 
+# ISO-8601 local timestamp computed by SQLite itself, matching the format
+# previously produced by ``datetime.now().isoformat()`` in Python.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+# Module-level SQL so the statement text is identity-stable and the hot
+# queries hit the connection's prepared-statement cache.
+_PROJECT_FIELDS = ("id", "title", "github_repo", "created_at", "updated_at")
+_SQL_INSERT_PROJECT = f"""
+    INSERT INTO archon_projects (title, github_repo, created_at, updated_at)
+    VALUES (?, ?, {_SQL_NOW}, {_SQL_NOW})
+    RETURNING {', '.join(_PROJECT_FIELDS)}
+"""
+_SQL_LIST_PROJECTS = f"SELECT {', '.join(_PROJECT_FIELDS)} FROM archon_projects ORDER BY created_at DESC"
+_SQL_GET_PROJECT = f"SELECT {', '.join(_PROJECT_FIELDS)} FROM archon_projects WHERE id = ?"
+_SQL_COUNT_PROJECTS = "SELECT COUNT(*) FROM archon_projects"
+_SQL_DELETE_PROJECT = "DELETE FROM archon_projects WHERE id = ?"
+
+# Small in-process read cache: project rows change rarely but are read on
+# every board refresh.  Entries expire after a short TTL (covering writes
+# from other processes) and the whole cache is dropped on any local write.
+_CACHE_TTL = 30.0
+_CACHE_MAX = 1024
+_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key: tuple[Any, ...]) -> Any | None:
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del _cache[key]
+            return None
+        return value
+
+
+def _cache_put(key: tuple[Any, ...], value: Any) -> None:
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def _cache_clear() -> None:
+    with _cache_lock:
+        _cache.clear()
+
 
 @dataclass
 class Project:
     title: str
     github_repo: str | None = None
-    created_at: str = datetime.now().isoformat()
-    updated_at: str = datetime.now().isoformat()
+    created_at: str | None = None
+    updated_at: str | None = None
     id: int | None = None
 
 
@@ -44,55 +94,76 @@ class ProjectService:
         if not title or not isinstance(title, str):
             return False, {"error": "Project title is required"}
 
-        project = Project(title=title.strip(), github_repo=github_repo)
-
-        with self.db_context() as cur:
-            cur.execute(
-                """
-                INSERT INTO archon_projects (title, github_repo, created_at, updated_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (project.title, project.github_repo, project.created_at, project.updated_at),
-            )
-            project.id = cur.lastrowid
-
-        logger.info("Project created", project_id=project.id)
-        return True, {"project": asdict(project)}
-
-    def list_projects(self) -> tuple[bool, dict[str, Any]]:
-        """Return all projects ordered by creation date."""
-
+        # RETURNING hands back the inserted row (including the SQL-generated
+        # timestamps) in the same round-trip as the insert.
         with self.db_context() as cur:
-            cur.execute(
-                "SELECT id, title, github_repo, created_at, updated_at FROM archon_projects ORDER BY created_at DESC"
-            )
-            rows = [dict(row) for row in cur.fetchall()]
-
-        return True, {"projects": rows, "total_count": len(rows)}
+            cur.execute(_SQL_INSERT_PROJECT, (title.strip(), github_repo))
+            row = cur.fetchone()
+            project = {k: row[k] for k in _PROJECT_FIELDS}
+
+        _cache_clear()
+        logger.info("Project created", project_id=project["id"])
+        return True, {"project": project}
+
+    def list_projects(
+        self, limit: int | None = None, offset: int = 0
+    ) -> tuple[bool, dict[str, Any]]:
+        """Return projects ordered by creation date, optionally paged.
+
+        With ``limit`` set only one page of rows is loaded and
+        ``total_count`` comes from a ``COUNT(*)`` instead of the page size.
+        """
+
+        cache_key = ("list", limit, offset)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return True, cached
+
+        with self.db_context("read") as cur:
+            if limit is not None:
+                cur.execute(f"{_SQL_LIST_PROJECTS} LIMIT ? OFFSET ?", (limit, offset))
+            else:
+                cur.execute(_SQL_LIST_PROJECTS)
+            rows = [{k: row[k] for k in _PROJECT_FIELDS} for row in cur]
+
+            if limit is None:
+                total_count = len(rows)
+            else:
+                cur.execute(_SQL_COUNT_PROJECTS)
+                total_count = cur.fetchone()[0]
+
+        result = {"projects": rows, "total_count": total_count}
+        _cache_put(cache_key, result)
+        return True, result
 
     def get_project(self, project_id: int) -> tuple[bool, dict[str, Any]]:
         """Get a project by its ID."""
 
-        with self.db_context() as cur:
-            cur.execute(
-                "SELECT id, title, github_repo, created_at, updated_at FROM archon_projects WHERE id = ?",
-                (project_id,),
-            )
+        cache_key = ("project", project_id)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return True, cached
+
+        with self.db_context("read") as cur:
+            cur.execute(_SQL_GET_PROJECT, (project_id,))
             row = cur.fetchone()
 
         if row is None:
             return False, {"error": f"Project with ID {project_id} not found"}
 
-        return True, {"project": dict(row)}
+        result = {"project": {k: row[k] for k in _PROJECT_FIELDS}}
+        _cache_put(cache_key, result)
+        return True, result
 
     def delete_project(self, project_id: int) -> tuple[bool, dict[str, Any]]:
         """Delete a project by ID."""
 
         with self.db_context() as cur:
-            cur.execute("DELETE FROM archon_projects WHERE id = ?", (project_id,))
+            cur.execute(_SQL_DELETE_PROJECT, (project_id,))
             deleted = cur.rowcount
 
         if deleted:
+            _cache_clear()
             logger.info("Project deleted", project_id=project_id)
             return True, {"deleted": project_id}
         return False, {"error": f"Project with ID {project_id} not found"}
@@ -6,7 +6,6 @@ service intentionally mirrors the simplified :mod:`ProjectService`.
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any
 
 from ..client_manager import SQLiteCursorContext
@@ -15,8 +14,37 @@ from ...config.logfire_config import get_logger
 logger = get_logger(__name__)
 
 
+# Valid Kanban statuses as a module-level frozenset: membership checks are
+# O(1) and skip the per-call attribute lookup on the hot board paths.
+_VALID_STATUSES: frozenset[str] = frozenset({"todo", "doing", "review", "done"})
+
+_BULK_INSERT_COLUMNS = 5
+# Stay under SQLite's default 999-parameter limit per statement.
+_BULK_INSERT_CHUNK = 999 // _BULK_INSERT_COLUMNS
+
+# ISO-8601 local timestamp computed by SQLite itself, matching the format
+# previously produced by ``datetime.now().isoformat()`` in Python.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+# Module-level SQL so the statement text is identity-stable and the hot
+# queries hit the connection's prepared-statement cache.
+_SQL_INSERT_TASK = f"""
+    INSERT INTO archon_tasks (project_id, title, description, status, assignee, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, {_SQL_NOW}, {_SQL_NOW})
+    RETURNING id
+"""
+_TASK_FIELDS = ("id", "project_id", "title", "description", "status", "assignee", "created_at", "updated_at")
+_SQL_LIST_TASKS = f"SELECT {', '.join(_TASK_FIELDS)} FROM archon_tasks"
+_SQL_LIST_TASKS_BY_PROJECT = f"{_SQL_LIST_TASKS} WHERE project_id = ?"
+_SQL_COUNT_TASKS = "SELECT COUNT(*) FROM archon_tasks"
+_SQL_COUNT_TASKS_BY_PROJECT = f"{_SQL_COUNT_TASKS} WHERE project_id = ?"
+_SQL_UPDATE_STATUS = (
+    f"UPDATE archon_tasks SET status = ?, updated_at = {_SQL_NOW} WHERE id = ? RETURNING id"
+)
+
+
 class TaskService:
-    VALID_STATUSES = ["todo", "doing", "review", "done"]
+    VALID_STATUSES = _VALID_STATUSES
 
     def __init__(self, db_context: type[SQLiteCursorContext] = SQLiteCursorContext):
         self.db_context = db_context
@@ -33,52 +61,107 @@ class TaskService:
         status: str = "todo",
         assignee: str = "User",
     ) -> tuple[bool, dict[str, Any]]:
-        if status not in self.VALID_STATUSES:
+        if status not in _VALID_STATUSES:
             return False, {"error": f"Invalid status '{status}'"}
 
         with self.db_context() as cur:
-            cur.execute(
-                """
-                INSERT INTO archon_tasks (project_id, title, description, status, assignee, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+            cur.execute(_SQL_INSERT_TASK, (project_id, title, description, status, assignee))
+            task_id = cur.fetchone()["id"]
+
+        return True, {"task": {"id": task_id, "title": title, "status": status}}
+
+    def create_tasks_bulk(self, tasks: list[dict[str, Any]]) -> tuple[bool, dict[str, Any]]:
+        """Insert many tasks in one transaction.
+
+        Each entry needs at least ``project_id`` and ``title``; ``description``,
+        ``status`` and ``assignee`` fall back to the same defaults as
+        :meth:`create_task`.  Wrapping all rows in a single transaction
+        amortises the per-commit fsync that otherwise dominates bulk inserts,
+        and rows are collapsed into multi-``VALUES`` statements so SQLite
+        parses one statement per chunk instead of resetting per row.
+        """
+
+        if not tasks:
+            return True, {"created_count": 0}
+
+        rows = []
+        for i, task in enumerate(tasks):
+            status = task.get("status", "todo")
+            if status not in _VALID_STATUSES:
+                return False, {"error": f"Invalid status '{status}' at index {i}"}
+            rows.append(
                 (
-                    project_id,
-                    title,
-                    description,
+                    task["project_id"],
+                    task["title"],
+                    task.get("description", ""),
                     status,
-                    assignee,
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                ),
+                    task.get("assignee", "User"),
+                )
             )
-            task_id = cur.lastrowid
 
-        return True, {"task": {"id": task_id, "title": title, "status": status}}
+        with self.db_context() as cur:
+            for start in range(0, len(rows), _BULK_INSERT_CHUNK):
+                chunk = rows[start : start + _BULK_INSERT_CHUNK]
+                sql = (
+                    "INSERT INTO archon_tasks (project_id, title, description, status, assignee, created_at, updated_at) VALUES "
+                    + ",".join([f"(?, ?, ?, ?, ?, {_SQL_NOW}, {_SQL_NOW})"] * len(chunk))
+                )
+                params: list[Any] = []
+                for row in chunk:
+                    params.extend(row)
+                cur.execute(sql, params)
+
+        return True, {"created_count": len(rows)}
+
+    def list_tasks(
+        self,
+        project_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[bool, dict[str, Any]]:
+        """List tasks, optionally filtered by project and paged.
 
-    def list_tasks(self, project_id: int | None = None) -> tuple[bool, dict[str, Any]]:
-        query = "SELECT * FROM archon_tasks"
+        With ``limit`` set only one page of rows is loaded and
+        ``total_count`` comes from an indexed ``COUNT(*)``, so response
+        size stays constant as the table grows.  Without ``limit`` the
+        full listing is returned as before.
+        """
+
+        query = _SQL_LIST_TASKS
+        count_query = _SQL_COUNT_TASKS
         params: tuple[Any, ...] = ()
         if project_id is not None:
-            query += " WHERE project_id = ?"
+            query = _SQL_LIST_TASKS_BY_PROJECT
+            count_query = _SQL_COUNT_TASKS_BY_PROJECT
             params = (project_id,)
 
-        with self.db_context() as cur:
-            cur.execute(query, params)
-            rows = [dict(r) for r in cur.fetchall()]
-
-        return True, {"tasks": rows, "total_count": len(rows)}
+        with self.db_context("read") as cur:
+            if limit is not None:
+                # Pin the row order so page membership is stable regardless
+                # of which index the planner walks.
+                cur.execute(f"{query} ORDER BY id LIMIT ? OFFSET ?", params + (limit, offset))
+            else:
+                cur.execute(query, params)
+            # Build dicts from a fixed field tuple while streaming off the
+            # cursor: cheaper than materialising sqlite3.Row objects via
+            # fetchall() and converting each with dict().
+            rows = [{k: row[k] for k in _TASK_FIELDS} for row in cur]
+
+            if limit is None:
+                total_count = len(rows)
+            else:
+                cur.execute(count_query, params)
+                total_count = cur.fetchone()[0]
+
+        return True, {"tasks": rows, "total_count": total_count}
 
     def update_status(self, task_id: int, status: str) -> tuple[bool, dict[str, Any]]:
-        if status not in self.VALID_STATUSES:
+        if status not in _VALID_STATUSES:
             return False, {"error": f"Invalid status '{status}'"}
 
         with self.db_context() as cur:
-            cur.execute(
-                "UPDATE archon_tasks SET status = ?, updated_at = ? WHERE id = ?",
-                (status, datetime.now().isoformat(), task_id),
-            )
-            if cur.rowcount == 0:
+            cur.execute(_SQL_UPDATE_STATUS, (status, task_id))
+            if cur.fetchone() is None:
                 return False, {"error": f"Task with ID {task_id} not found"}
 
         return True, {"task": {"id": task_id, "status": status}}
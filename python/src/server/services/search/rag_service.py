@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from ...config.logfire_config import get_logger, safe_span
@@ -52,6 +53,35 @@ class RAGService:
             span.set_attribute("results_found", len(results))
             return results
 
+    async def search_both(
+        self, query: str, match_count: int = 5, filter_metadata: dict | None = None
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Search the ``docs`` and ``code`` collections concurrently.
+
+        The query is embedded once and both vector searches run in
+        parallel, so querying both collections costs one embedding call
+        and roughly one search round-trip instead of two of each.
+        """
+
+        with safe_span("rag_search_both", query_length=len(query), match_count=match_count) as span:
+            query_embedding = await create_embedding(query)
+            docs, code = await asyncio.gather(
+                self.base_strategy.vector_search(
+                    query_embedding=query_embedding,
+                    match_count=match_count,
+                    filter_metadata=filter_metadata,
+                    table_rpc="match_archon_crawled_pages",
+                ),
+                self.base_strategy.vector_search(
+                    query_embedding=query_embedding,
+                    match_count=match_count,
+                    filter_metadata=filter_metadata,
+                    table_rpc="match_archon_code_examples",
+                ),
+            )
+            span.set_attribute("results_found", len(docs) + len(code))
+            return docs, code
+
 
 __all__ = ["RAGService"]
 